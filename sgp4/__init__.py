@@ -145,6 +145,10 @@ getting loaded correctly, try calling the slow pure-Python version of
 
 Any TLE formatting errors will be raised as a ``ValueError``.
 
+Those extra checks come at a price, so when loading a large catalog of
+satellites, stick with ``Satrec.twoline2rv()``: if ``accelerated`` is
+true, then it parses each TLE entirely in compiled C++.
+
 Using OMM elements instead of TLE
 ---------------------------------
 
@@ -637,6 +641,9 @@ Unreleased — 2.24
 * Tweaked the fallback Python code to accept TLE lines without a final
   checksum character in the 69th column, to match the C++ code.
 
+* Added ``sgp4.io.checksums_match()``, which uses NumPy to check the
+  checksums of a whole file's worth of TLE lines at once.
+
 2023-10-01 — 2.23
 
 * Tweaked tests to resolve breakage introduced by Python 3.12.
@@ -1,5 +1,9 @@
 """Alpha 5 encoding of satellite numbers to fit in 5 characters."""
 
+# Alpha 5 skips the letters I and O, to avoid confusion with digits.
+_letters = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
+_leading_values = dict((c, 10 + i) for i, c in enumerate(_letters))
+
 def to_alpha5(n):
     if n < 100000:
         return '%05d' % n
@@ -7,16 +11,16 @@ def to_alpha5(n):
         raise ValueError('satellite number cannot exceed 339999,'
                          " whose Alpha 5 encoding is 'Z9999'")
     i, n = divmod(n, 10000)
-    i += ord('A') - 10
-    if i >= ord('I'): i += 1
-    if i >= ord('O'): i += 1
-    return '%c%04d' % (i, n)
+    return '%s%04d' % (_letters[i - 10], n)
 
 def from_alpha5(s):
-    if not s[0].isalpha():
-        return int(s)
-    c, s = s[0], s[1:]
-    n = ord(c) - ord('A') + 10
-    n -= c > 'I'
-    n -= c > 'O'
-    return n * 10000 + int(s)
+    c = s[0]
+    n = _leading_values.get(c)
+    if n is None:
+        if not c.isalpha():
+            return int(s)
+        # Decode I, O, and lowercase letters the way the C++ code does.
+        n = ord(c) - ord('A') + 10
+        n -= c > 'I'
+        n -= c > 'O'
+    return n * 10000 + int(s[1:])
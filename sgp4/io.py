@@ -9,9 +9,6 @@ from math import pi, pow
 from sgp4.ext import days2mdhms, invjday, jday
 from sgp4.propagation import sgp4init
 
-INT_RE = re.compile(r'[+-]?\d*')
-FLOAT_RE = re.compile(r'[+-]?\d*(\.\d*)?')
-
 LINE1 = '1 NNNNNC NNNNNAAA NNNNN.NNNNNNNN +.NNNNNNNN +NNNNN-N +NNNNN-N N NNNNN'
 LINE2 = '2 NNNNN NNN.NNNN NNN.NNNN NNNNNNN NNN.NNNN NNN.NNNN NN.NNNNNNNNNNNNNN'
 
@@ -25,6 +22,33 @@ with an N where each digit should go, followed by the line you provided:
 {1}
 {2}"""
 
+# Each TLE line must be long enough and must have every space and
+# period in exactly the right column; other characters are not checked.
+_line1_match = re.compile(
+    r'1 .{6} .{14}\..{8} .\..{8} .{8} .{8} . ', re.DOTALL).match
+_line2_match = re.compile(
+    r'2 .{5} .{3}\..{4} .{3}\..{4} .{7} .{3}\..{4} .{3}\..{4} .{16}',
+    re.DOTALL).match
+
+deg2rad  =   pi / 180.0;         #    0.0174532925199433
+xpdotp   =  1440.0 / (2.0 *pi);  #  229.1831180523293
+_ndot_divisor = xpdotp * 1440.0
+_nddot_divisor = xpdotp * 1440.0 * 1440
+
+# A two-column TLE exponent can only run from -9 through 99.
+_powers_of_ten = dict((n, pow(10.0, n)) for n in range(-9, 100))
+
+# The Julian date of "January 0" of each year a two-digit TLE year can
+# name, to which the TLE's day of the year is added.
+_jan0_jd = dict((year, jday(year, 1, 0, 0, 0, 0.0))
+                for year in range(1957, 2057))
+
+# Each digit counts as its own value, each minus sign counts as 1, and
+# every other character counts as 0.
+_checksum_values = bytes(bytearray(
+    (b - 48) if 48 <= b <= 57 else (b == 45) for b in range(256)
+))
+
 """
 /*     ----------------------------------------------------------------
 *
@@ -98,7 +122,8 @@ with an N where each digit should go, followed by the line you provided:
   --------------------------------------------------------------------------- */
 """
 
-def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
+def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None,
+               set_epoch=True):
     """Return a Satellite imported from two lines of TLE data.
 
     Provide the two TLE lines as strings `longstr1` and `longstr2`,
@@ -113,10 +138,10 @@ def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
     to the algorithm.  If you want to turn some of these off and go
     back into "opsmode" mode, then set `opsmode` to `a`.
 
-    """
+    A `satrec` object you supply also receives a datetime `epoch`, as
+    in 1.x, unless you set `set_epoch` to false.
 
-    deg2rad  =   pi / 180.0;         #    0.0174532925199433
-    xpdotp   =  1440.0 / (2.0 *pi);  #  229.1831180523293
+    """
 
     # For compatibility with our 1.x API, build an old Satellite object
     # if the caller fails to supply a satrec.  In that case we perform
@@ -124,6 +149,7 @@ def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
     if satrec is None:
         from sgp4.model import Satellite
         satrec = Satellite()
+        set_epoch = False  # Satellite builds its epoch on first access
 
     satrec.error = 0;
 
@@ -138,26 +164,17 @@ def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
         raise ValueError('your TLE lines are broken because they contain'
                          ' non-ASCII characters:\n\n%s\n%s' % (r1, r2))
 
-    if (len(line) >= 64 and
-        line.startswith('1 ') and
-        line[8] == ' ' and
-        line[23] == '.' and
-        line[32] == ' ' and
-        line[34] == '.' and
-        line[43] == ' ' and
-        line[52] == ' ' and
-        line[61] == ' ' and
-        line[63] == ' '):
-
-        satrec.satnum_str = line[2:7]
+    if _line1_match(line):
+
+        satnum_str = line[2:7]
         satrec.classification = line[7] or 'U'
         satrec.intldesg = line[9:17].rstrip()
         two_digit_year = int(line[18:20])
-        satrec.epochdays = float(line[20:32])
-        satrec.ndot = float(line[33:43])
-        satrec.nddot = float(line[44] + '.' + line[45:50])
+        satrec.epochdays = epochdays = float(line[20:32])
+        ndot = float(line[33:43])
+        nddot = float(line[44] + '.' + line[45:50])
         nexp = int(line[50:52])
-        satrec.bstar = float(line[53] + '.' + line[54:59])
+        bstar = float(line[53] + '.' + line[54:59])
         ibexp = int(line[59:61])
         satrec.ephtype = line[62]
         satrec.elnum = int(line[64:68])
@@ -166,47 +183,40 @@ def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
 
     line = longstr2.rstrip()
 
-    if (len(line) >= 68 and
-        line.startswith('2 ') and
-        line[7] == ' ' and
-        line[11] == '.' and
-        line[16] == ' ' and
-        line[20] == '.' and
-        line[25] == ' ' and
-        line[33] == ' ' and
-        line[37] == '.' and
-        line[42] == ' ' and
-        line[46] == '.' and
-        line[51] == ' '):
-
-        if satrec.satnum_str != line[2:7]:
+    if _line2_match(line):
+
+        if satnum_str != line[2:7]:
             raise ValueError('Object numbers in lines 1 and 2 do not match')
 
-        satrec.inclo = float(line[8:16])
-        satrec.nodeo = float(line[17:25])
-        satrec.ecco = float('0.' + line[26:33].replace(' ', '0'))
-        satrec.argpo = float(line[34:42])
-        satrec.mo = float(line[43:51])
-        satrec.no_kozai = float(line[52:63])
+        inclo = float(line[8:16])
+        nodeo = float(line[17:25])
+        # Measured faster than either str.translate() or int() / 1e7.
+        ecco = float('0.' + line[26:33].replace(' ', '0'))
+        argpo = float(line[34:42])
+        mo = float(line[43:51])
+        no_kozai = float(line[52:63])
         satrec.revnum = line[63:68]
     #except (AssertionError, IndexError, ValueError):
     else:
         raise ValueError(error_message.format(2, LINE2, line))
 
+    # The elements are kept in local variables until sgp4init() stores
+    # them on the satrec, saving an attribute round trip for each one.
+
     #  ---- find no, ndot, nddot ----
-    satrec.no_kozai = satrec.no_kozai / xpdotp; #   rad/min
-    satrec.nddot= satrec.nddot * pow(10.0, nexp);
-    satrec.bstar= satrec.bstar * pow(10.0, ibexp);
+    no_kozai = no_kozai / xpdotp; #   rad/min
+    nddot= nddot * _powers_of_ten[nexp];
+    bstar= bstar * _powers_of_ten[ibexp];
 
     #  ---- convert to sgp4 units ----
-    satrec.ndot = satrec.ndot  / (xpdotp*1440.0);  #   ? * minperday
-    satrec.nddot= satrec.nddot / (xpdotp*1440.0*1440);
+    ndot = ndot  / _ndot_divisor;  #   ? * minperday
+    nddot= nddot / _nddot_divisor;
 
     #  ---- find standard orbital elements ----
-    satrec.inclo = satrec.inclo  * deg2rad;
-    satrec.nodeo = satrec.nodeo  * deg2rad;
-    satrec.argpo = satrec.argpo  * deg2rad;
-    satrec.mo    = satrec.mo     * deg2rad;
+    inclo = inclo  * deg2rad;
+    nodeo = nodeo  * deg2rad;
+    argpo = argpo  * deg2rad;
+    mo    = mo     * deg2rad;
 
 
     """
@@ -224,27 +234,37 @@ def twoline2rv(longstr1, longstr2, whichconst, opsmode='i', satrec=None):
     else:
         year = two_digit_year + 1900;
 
-    mon,day,hr,minute,sec = days2mdhms(year, satrec.epochdays);
-    sec_whole, sec_fraction = divmod(sec, 1.0)
-
     satrec.epochyr = year
-    satrec.jdsatepoch = jday(year,mon,day,hr,minute,sec);
+    satrec.jdsatepoch = jdsatepoch = _jan0_jd[year] + epochdays;
+
+    if set_epoch:
+        satrec.epoch = _epoch_datetime(satrec)
+
+    #  ---------------- initialize the orbit at sgp4epoch -------------------
+    sgp4init(whichconst, opsmode, satnum_str, jdsatepoch-2433281.5, bstar,
+             ndot, nddot, ecco, argpo, inclo, mo,
+             no_kozai, nodeo, satrec)
+
+    return satrec
+
+def _epoch_datetime(satrec):
+    """Return the epoch of a legacy Satellite as a naive `datetime`.
+
+    Building a `datetime` is much slower than the rest of TLE parsing,
+    so the legacy `Satellite.epoch` attribute calls this on first access.
+
+    """
+    year = satrec.epochyr
+    mon, day, hr, minute, sec = days2mdhms(year, satrec.epochdays)
+    sec_whole = int(sec)  # sec is never negative, so this floors it
+    microsecond = int((sec - sec_whole) * 1000000.0)
     try:
-        satrec.epoch = datetime(year, mon, day, hr, minute, int(sec_whole),
-                                int(sec_fraction * 1000000.0 // 1.0))
+        return datetime(year, mon, day, hr, minute, sec_whole, microsecond)
     except ValueError:
         # Sometimes a TLE says something like "2019 + 366.82137887 days"
         # which would be December 32nd which causes a ValueError.
         year, mon, day, hr, minute, sec = invjday(satrec.jdsatepoch)
-        satrec.epoch = datetime(year, mon, day, hr, minute, int(sec_whole),
-                                int(sec_fraction * 1000000.0 // 1.0))
-
-    #  ---------------- initialize the orbit at sgp4epoch -------------------
-    sgp4init(whichconst, opsmode, satrec.satnum_str, satrec.jdsatepoch-2433281.5, satrec.bstar,
-             satrec.ndot, satrec.nddot, satrec.ecco, satrec.argpo, satrec.inclo, satrec.mo,
-             satrec.no_kozai, satrec.nodeo, satrec)
-
-    return satrec
+        return datetime(year, mon, day, hr, minute, sec_whole, microsecond)
 
 def verify_checksum(*lines):
     """Verify the checksum of one or more TLE lines.
@@ -264,6 +284,25 @@ def verify_checksum(*lines):
                          ' but in fact tallies to {}:\n{}')
             raise ValueError(complaint.format(checksum, computed, line))
 
+def checksums_match(lines):
+    """Check the checksums of many TLE lines at once, using NumPy.
+
+    Returns a NumPy array of booleans, one for each line, that is false
+    only where a line's checksum digit disagrees with its contents.
+    Like `verify_checksum()`, this skips lines without a checksum.
+
+    """
+    from numpy import frombuffer, uint8
+
+    lines = [line[:69].ljust(69) for line in lines]
+    data = _ascii_bytes(''.join(lines))
+    codes = frombuffer(data, uint8).reshape(len(lines), 69)
+    values = frombuffer(data.translate(_checksum_values), uint8)
+    computed = values.reshape(len(lines), 69)[:,:68].sum(axis=1) % 10
+    checksum = codes[:,68]
+    has_checksum = (checksum >= 48) & (checksum <= 57)
+    return (computed + 48 == checksum) | ~has_checksum
+
 def fix_checksum(line):
     """Return a new copy of the TLE `line`, with the correct checksum appended.
 
@@ -275,4 +314,13 @@ def fix_checksum(line):
 
 def compute_checksum(line):
     """Compute the TLE checksum for the given line."""
-    return sum((int(c) if c.isdigit() else c == '-') for c in line[0:68]) % 10
+    codes = bytearray(_ascii_bytes(line[0:68]))
+    return sum(codes.translate(_checksum_values)) % 10
+
+def _ascii_bytes(text):
+    # A Python 2 byte string is used as-is, since decoding it as ASCII
+    # would fail on any non-ASCII byte; `_checksum_values` maps those
+    # bytes to 0 anyway, as it does the '?' that replaces other text.
+    if isinstance(text, bytes):
+        return text
+    return text.encode('ascii', 'replace')
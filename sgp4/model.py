@@ -3,7 +3,7 @@
 from sgp4.alpha5 import from_alpha5
 from sgp4.earth_gravity import wgs72old, wgs72, wgs84
 from sgp4.ext import invjday, jday
-from sgp4.io import twoline2rv
+from sgp4.io import _epoch_datetime, twoline2rv
 from sgp4.propagation import sgp4, sgp4init
 
 WGS72OLD = 0
@@ -26,7 +26,7 @@ class Satrec(object):
         'd2211', 'd3', 'd3210', 'd3222', 'd4', 'd4410', 'd4422', 'd5220',
         'd5232', 'd5421', 'd5433', 'dedt', 'del1', 'del2', 'del3', 'delmo',
         'didt', 'dmdt', 'dnodt', 'domdt', 'e3', 'ecco', 'ee2', 'elnum', 'em',
-        'ephtype', 'epoch', 'epochdays', 'epochyr', 'error', 'error_message',
+        'ephtype', 'epochdays', 'epochyr', 'error', 'error_message',
         'eta', 'gsto', 'im', 'inclo', 'init', 'intldesg', 'irez', 'isimp',
         'j2', 'j3', 'j3oj2', 'j4', 'jdsatepoch', 'mdot', 'method', 'mm', 'mo',
         'mu', 'nddot', 'ndot', 'nm', 'no_kozai', 'no_unkozai', 'nodecf',
@@ -54,7 +54,7 @@ class Satrec(object):
     def twoline2rv(cls, line1, line2, whichconst=WGS72):
         whichconst = gravity_constants[whichconst]
         self = cls()
-        twoline2rv(line1, line2, whichconst, 'i', self)
+        twoline2rv(line1, line2, whichconst, 'i', self, False)
 
         # Expose the same attribute types as the C++ code.
         self.ephtype = int(self.ephtype.strip() or '0')
@@ -67,10 +67,6 @@ class Satrec(object):
         self.jdsatepoch = year * 365 + (year - 1) // 4 + days + 1721044.5
         self.jdsatepochF = round(fraction, 8)  # exact number of digits in TLE
 
-        # Remove the legacy datetime "epoch", which is not provided by
-        # the C++ version of the object.
-        del self.epoch
-
         # Undo my non-standard 4-digit year
         self.epochyr %= 100
         return self
@@ -101,6 +97,9 @@ class Satrec(object):
                  ecco, argpo, inclo, mo, no_kozai, nodeo, self)
 
     def sgp4(self, jd, fr):
+        # Subtract before scaling: the difference between two nearby
+        # Julian dates is exact, whereas a precomputed epoch in minutes
+        # (around 3.5e9) would round away about 30 microseconds.
         tsince = ((jd - self.jdsatepoch) * minutes_per_day +
                   (fr - self.jdsatepochF) * minutes_per_day)
         r, v = sgp4(self, tsince)
@@ -128,17 +127,30 @@ class Satrec(object):
             from numpy import array
             Satrec.array = array
 
-        results = []
-        z = list(zip(jd, fr))
-        for jd_i, fr_i in z:
-            results.append(self.sgp4(jd_i, fr_i))
-        elist, rlist, vlist = zip(*results)
-
-        e = array(elist)
-        r = array(rlist)
-        v = array(vlist)
+        # Compute every tsince with a few NumPy operations, then hand
+        # sgp4() plain Python floats, which do math much faster than
+        # NumPy scalars do.
+        jd = array(jd, 'float64')
+        fr = array(fr, 'float64')
+        tsince = ((jd - self.jdsatepoch) * minutes_per_day +
+                  (fr - self.jdsatepochF) * minutes_per_day)
 
-        r.shape = v.shape = len(jd), 3
+        # Gather flat lists of floats, which NumPy converts far faster
+        # than it can a list of tuples.
+        elist = []
+        rlist = []
+        vlist = []
+        for t in tsince.tolist():
+            r, v = sgp4(self, t)
+            elist.append(self.error)
+            rlist.extend(r)
+            vlist.extend(v)
+
+        e = array(elist, 'uint8')
+        r = array(rlist, 'float64')
+        v = array(vlist, 'float64')
+
+        r.shape = v.shape = len(elist), 3
         return e, r, v
 
 class SatrecArray(object):
@@ -168,23 +180,26 @@ class SatrecArray(object):
         * ``v``: (dx,dy,dz) velocity vector in kilometers per second.
 
         """
-        results = []
-        z = list(zip(jd, fr))
-        for satrec in self._satrecs:
-            for jd_i, fr_i in z:
-                results.append(satrec.sgp4(jd_i, fr_i))
+        # Let NumPy stack each satellite's arrays into the final
+        # (satellite, time) and (satellite, time, xyz) arrays.
+        results = [satrec.sgp4_array(jd, fr) for satrec in self._satrecs]
         elist, rlist, vlist = zip(*results)
+        array = self.array
+        return array(elist), array(rlist), array(vlist)
 
-        e = self.array(elist)
-        r = self.array(rlist)
-        v = self.array(vlist)
+class _Epoch(object):
+    """Build a legacy Satellite's `epoch` datetime on first access.
 
-        jdlen = len(jd)
-        mylen = len(self._satrecs)
-        e.shape = (mylen, jdlen)
-        r.shape = v.shape = (mylen, jdlen, 3)
+    Defining only `__get__()` makes this a non-data descriptor, so the
+    datetime it saves in the instance dict is returned directly by later
+    reads, and callers can still assign `epoch` a value of their own.
 
-        return e, r, v
+    """
+    def __get__(self, sat, cls):
+        if sat is None:
+            return self
+        epoch = sat.__dict__['epoch'] = _epoch_datetime(sat)
+        return epoch
 
 class Satellite(object):
     """The old Satellite object, for compatibility with sgp4 1.x."""
@@ -200,3 +215,4 @@ class Satellite(object):
 
     no = Satrec.no
     satnum = Satrec.satnum
+    epoch = _Epoch()
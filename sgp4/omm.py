@@ -1,6 +1,7 @@
 """Support for Orbit Mean-Elements Message (OMM) orbital elements format."""
 
 import csv
+import re
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from math import pi
@@ -10,8 +11,11 @@ def parse_csv(file):
     return csv.DictReader(file)
 
 def parse_xml(file):
-    root = ET.parse(file).getroot()
-    for segment in root.findall('.//segment'):
+    # Stream the file, so a large archive is never held in memory as
+    # one big tree; each segment is cleared once its fields are read.
+    for event, segment in ET.iterparse(file):
+        if segment.tag != 'segment':
+            continue
         metadata = segment.find('metadata')
         data = segment.find('data')
         meanElements = data.find('meanElements')
@@ -19,13 +23,32 @@ def parse_xml(file):
         fields = {}
         for element in metadata, meanElements, tleParameters:
             fields.update((field.tag, field.text) for field in element)
+        segment.clear()
         yield fields
 
 _epoch0 = datetime(1949, 12, 31)
+_epoch_format = '%Y-%m-%dT%H:%M:%S.%f'
+_epoch_match = re.compile(
+    r'(\d{4})-(\d\d?)-(\d\d?)T(\d\d?):(\d\d?):(\d\d?)\.(\d{1,6})\Z').match
 _to_radians = pi / 180.0
 _ndot_units = 1036800.0 / pi  # See SGP4.cpp for details.
 _nddot_units = 2985984000.0 / 2.0 / pi  # See SGP4.cpp for details.
 
+def _parse_epoch(text):
+    # Much faster than strptime(), which we still call for its error
+    # message if the text is not in the expected format or any of its
+    # fields, like a 13th month, is out of range.
+    match = _epoch_match(text)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day), int(hour),
+                            int(minute), int(second),
+                            int(fraction.ljust(6, '0')))
+        except ValueError:
+            pass
+    return datetime.strptime(text, _epoch_format)
+
 def initialize(sat, fields):
     sat.classification = fields['CLASSIFICATION_TYPE']
     sat.intldesg = fields['OBJECT_ID'][2:].replace('-', '')
@@ -33,7 +56,7 @@ def initialize(sat, fields):
     sat.elnum = int(fields['ELEMENT_SET_NO'])
     sat.revnum = int(fields['REV_AT_EPOCH'])
 
-    epoch_datetime = datetime.strptime(fields['EPOCH'], '%Y-%m-%dT%H:%M:%S.%f')
+    epoch_datetime = _parse_epoch(fields['EPOCH'])
     epoch = (epoch_datetime - _epoch0).total_seconds() / 86400.0
 
     argpo = float(fields['ARG_OF_PERICENTER']) * _to_radians
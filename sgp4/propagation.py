@@ -17,7 +17,7 @@ code for the first time here in its Python form.
 |   On a very hot August day in 2012
 
 """
-from math import atan2, cos, fabs, pi, sin, sqrt
+from math import atan2, copysign, cos, fabs, fmod, pi, sin, sqrt
 from sgp4.alpha5 import to_alpha5
 
 deg2rad = pi / 180.0;
@@ -271,7 +271,7 @@ def _dpper(satrec, inclo, init, ep, inclp, nodep, argpp, mp, opsmode):
            dbet   = -ph * sinop + pinc * cosip * cosop;
            alfdp  = alfdp + dalf;
            betdp  = betdp + dbet;
-           nodep  = nodep % twopi if nodep >= 0.0 else -(-nodep % twopi)
+           nodep  = fmod(nodep, twopi)
            #   sgp4fix for afspc written intrinsic functions
            #  nodep used without a trigonometric function ahead
            if nodep < 0.0 and opsmode == 'a':
@@ -510,6 +510,7 @@ def _dscom(
 
      zmol = (4.7199672 + 0.22997150  * day - gam) % twopi
      zmos = (6.2565837 + 0.017201977 * day) % twopi
+     l4em = -21.0 - 9.0 * emsq;  # shared by sl4 and xl4
 
      #  ------------------------ do solar terms ----------------------
      se2  =   2.0 * ss1 * ss6;
@@ -518,7 +519,7 @@ def _dscom(
      si3  =   2.0 * ss2 * (sz13 - sz11);
      sl2  =  -2.0 * ss3 * sz2;
      sl3  =  -2.0 * ss3 * (sz3 - sz1);
-     sl4  =  -2.0 * ss3 * (-21.0 - 9.0 * emsq) * zes;
+     sl4  =  -2.0 * ss3 * l4em * zes;
      sgh2 =   2.0 * ss4 * sz32;
      sgh3 =   2.0 * ss4 * (sz33 - sz31);
      sgh4 = -18.0 * ss4 * zes;
@@ -532,7 +533,7 @@ def _dscom(
      xi3  =   2.0 * s2 * (z13 - z11);
      xl2  =  -2.0 * s3 * z2;
      xl3  =  -2.0 * s3 * (z3 - z1);
-     xl4  =  -2.0 * s3 * (-21.0 - 9.0 * emsq) * zel;
+     xl4  =  -2.0 * s3 * l4em * zel;
      xgh2 =   2.0 * s4 * z32;
      xgh3 =   2.0 * s4 * (z33 - z31);
      xgh4 = -18.0 * s4 * zel;
@@ -1005,9 +1006,7 @@ def _dspace(
          else:
                delt = stepn;
 
-         iretn = 381; # added for do loop
-         # iret  =   0; # added for loop
-         while iretn == 381:
+         while True:
 
              #  ------------------- dot terms calculated -------------
              #  ----------- near - synchronous resonance terms -------
@@ -1044,19 +1043,14 @@ def _dspace(
              #  ----------------------- integrator -------------------
              #  sgp4fix move end checks to end of routine
              if fabs(t - atime) >= stepp:
-                 # iret  = 0;
-                 iretn = 381;
-
-             else:
-                 ft    = t - atime;
-                 iretn = 0;
-
-             if iretn == 381:
-
                  xli   = xli + xldot * delt + xndt * step2;
                  xni   = xni + xndt * delt + xnddt * step2;
                  atime = atime + delt;
 
+             else:
+                 ft    = t - atime;
+                 break
+
          nm = xni + xndt * ft + xnddt * ft * ft * 0.5;
          xl = xli + xldot * ft + xndt * ft * ft * 0.5;
          if irez != 1:
@@ -1711,20 +1705,20 @@ def sgp4(satrec, tsince, whichconst=None):
      satrec.error_message = None
 
      #  ------- update for secular gravity and atmospheric drag -----
-     xmdf    = satrec.mo + satrec.mdot * satrec.t;
-     argpdf  = satrec.argpo + satrec.argpdot * satrec.t;
-     nodedf  = satrec.nodeo + satrec.nodedot * satrec.t;
+     xmdf    = satrec.mo + satrec.mdot * tsince;
+     argpdf  = satrec.argpo + satrec.argpdot * tsince;
+     nodedf  = satrec.nodeo + satrec.nodedot * tsince;
      argpm   = argpdf;
      mm      = xmdf;
-     t2      = satrec.t * satrec.t;
+     t2      = tsince * tsince;
      nodem   = nodedf + satrec.nodecf * t2;
-     tempa   = 1.0 - satrec.cc1 * satrec.t;
-     tempe   = satrec.bstar * satrec.cc4 * satrec.t;
+     tempa   = 1.0 - satrec.cc1 * tsince;
+     tempe   = satrec.bstar * satrec.cc4 * tsince;
      templ   = satrec.t2cof * t2;
 
      if satrec.isimp != 1:
 
-         delomg = satrec.omgcof * satrec.t;
+         delomg = satrec.omgcof * tsince;
          #  sgp4fix use mutliply for speed instead of pow
          delmtemp =  1.0 + satrec.eta * cos(xmdf);
          delm   = satrec.xmcof * \
@@ -1733,21 +1727,21 @@ def sgp4(satrec, tsince, whichconst=None):
          temp   = delomg + delm;
          mm     = xmdf + temp;
          argpm  = argpdf - temp;
-         t3     = t2 * satrec.t;
-         t4     = t3 * satrec.t;
+         t3     = t2 * tsince;
+         t4     = t3 * tsince;
          tempa  = tempa - satrec.d2 * t2 - satrec.d3 * t3 - \
                           satrec.d4 * t4;
          tempe  = tempe + satrec.bstar * satrec.cc5 * (sin(mm) -
                           satrec.sinmao);
          templ  = templ + satrec.t3cof * t3 + t4 * (satrec.t4cof +
-                          satrec.t * satrec.t5cof);
+                          tsince * satrec.t5cof);
 
      nm    = satrec.no_unkozai;
      em    = satrec.ecco;
      inclm = satrec.inclo;
      if satrec.method == 'd':
 
-         tc = satrec.t;
+         tc = tsince;
          (
              atime, em,    argpm,  inclm, xli,
              mm,    xni,   nodem,  dndt,  nm,
@@ -1759,7 +1753,7 @@ def sgp4(satrec, tsince, whichconst=None):
                satrec.d5433, satrec.dedt,  satrec.del1,
                satrec.del2,  satrec.del3,  satrec.didt,
                satrec.dmdt,  satrec.dnodt, satrec.domdt,
-               satrec.argpo, satrec.argpdot, satrec.t, tc,
+               satrec.argpo, satrec.argpdot, tsince, tc,
                satrec.gsto, satrec.xfact, satrec.xlamo,
                satrec.no_unkozai, satrec.atime,
                em, argpm, inclm, satrec.xli, mm, satrec.xni,
@@ -1796,7 +1790,7 @@ def sgp4(satrec, tsince, whichconst=None):
      emsq   = em * em;
      temp   = 1.0 - emsq;
 
-     nodem  = nodem % twopi if nodem >= 0.0 else -(-nodem % twopi)
+     nodem  = fmod(nodem, twopi)
      argpm  = argpm % twopi
      xlm    = xlm % twopi
      mm     = (xlm - argpm - nodem) % twopi
@@ -1873,7 +1867,7 @@ def sgp4(satrec, tsince, whichconst=None):
          tem5   = 1.0 - coseo1 * axnl - sineo1 * aynl;
          tem5   = (u - aynl * coseo1 + axnl * sineo1 - eo1) / tem5;
          if fabs(tem5) >= 0.95:
-             tem5 = 0.95 if tem5 > 0.0 else -0.95;
+             tem5 = copysign(0.95, tem5);
          eo1    = eo1 + tem5;
          ktr = ktr + 1;
 
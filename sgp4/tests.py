@@ -6,6 +6,7 @@ except ImportError:
     from unittest import TestCase, main
 
 import datetime as dt
+import pickle
 import re
 import os
 import sys
@@ -20,7 +21,7 @@ except ImportError:
 
 import numpy as np
 
-from sgp4.api import WGS72OLD, WGS72, WGS84, Satrec, jday
+from sgp4.api import WGS72OLD, WGS72, WGS84, Satrec, SatrecArray, jday
 from sgp4.earth_gravity import wgs72
 from sgp4.ext import invjday, newtonnu, rv2coe
 from sgp4.functions import days2mdhms, _day_of_year_to_month_day
@@ -129,6 +130,37 @@ def test_whether_array_logic_writes_nan_values_to_correct_row():
     assert np.isnan(r).tolist() == [[False, False, False], [True, True, True]]
     assert np.isnan(v).tolist() == [[False, False, False], [True, True, True]]
 
+def test_satrec_array_matches_each_satellite():
+    l1 = '1 25544U 98067A   19343.69339541  .00001764  00000-0  38792-4 0  9991'
+    l2 = '2 25544  51.6439 211.2001 0007417  17.6667  85.6398 15.50103472202482'
+    sats = [Satrec.twoline2rv(LINE1, LINE2), Satrec.twoline2rv(l1, l2)]
+    jd = np.array([2458826.5, 2458827.5, 2458828.5])
+    fr = np.array([0.8625, 0.0, 0.25])
+    e, r, v = SatrecArray(sats).sgp4(jd, fr)
+    assertEqual(e.shape, (2, 3))
+    assertEqual(r.shape, (2, 3, 3))
+    assertEqual(v.shape, (2, 3, 3))
+    for i, sat in enumerate(sats):
+        e1, r1, v1 = sat.sgp4_array(jd, fr)
+        assertEqual(e[i].tolist(), e1.tolist())
+        assertEqual(r[i].tolist(), r1.tolist())
+        assertEqual(v[i].tolist(), v1.tolist())
+
+def test_python_and_cpp_compute_identical_tsince():
+    # Both implementations scale the jd and fr differences by 1440
+    # separately, so their tsince values should agree exactly.
+    if not api.accelerated:
+        return
+    assert Satrec is not model.Satrec
+    fast = Satrec.twoline2rv(LINE1, LINE2)
+    slow = model.Satrec.twoline2rv(LINE1, LINE2)
+    for i in range(1000):
+        jd = fast.jdsatepoch + i % 7 - 3
+        fr = i / 997.0 - 0.5
+        fast.sgp4(jd, fr)
+        slow.sgp4(jd, fr)
+        assertEqual(fast.t, slow.t)
+
 # ------------------------------------------------------------------------
 #                 Other Officially Supported Routines
 #
@@ -184,6 +216,19 @@ def test_bad_tle_checksum():
     assertRaises(ValueError, io.verify_checksum, bad)
     assertEqual(io.fix_checksum(bad), LINE1)
 
+def test_checksum_ignores_non_ascii_characters():
+    # A plain literal: a byte string under Python 2, text under Python 3.
+    line = '1 -- \xe9'
+    assertEqual(io.compute_checksum(line), 3)
+    assertEqual(io.fix_checksum(line)[-1], '3')
+
+def test_checksums_match():
+    bad = LINE1[:68] + '7'
+    lines = [LINE1, LINE2, bad, LINE1[:68], LINE2 + '\n']
+    assertEqual(list(io.checksums_match(lines)),
+                [True, True, False, True, True])
+    assertEqual(list(io.checksums_match([])), [])
+
 def test_tle_export():
     """Check `export_tle()` round-trip using all the TLEs in the test file.
 
@@ -351,6 +396,18 @@ def test_satnum_alpha5_encoding():
         sat.sgp4init(WGS72, 'i', satnum, VANGUARD_EPOCH, *args)
         assertEqual(sat.satnum, satnum)
 
+def test_satnum_with_non_alpha5_leading_letter():
+    # Alpha 5 never uses I, O, or lowercase, but both implementations
+    # decode them with the same arithmetic rather than failing.
+    cases = [(180000, 'I0000'), (231234, 'O1234'), (400001, 'a0001')]
+    for satnum, satnum_string in cases:
+        line1 = LINE1.replace('00005', satnum_string)
+        line2 = LINE2.replace('00005', satnum_string)
+        sat = model.Satrec.twoline2rv(line1, line2)
+        assertEqual(sat.satnum, satnum)
+        if api.accelerated:
+            assertEqual(Satrec.twoline2rv(line1, line2).satnum, satnum)
+
 def test_satnum_that_is_too_large():
     sat = Satrec()
     with assertRaisesRegex(ValueError, 'cannot exceed 339999'):
@@ -481,6 +538,25 @@ def test_december_32():
     sat = Satrec.twoline2rv(a, b)
     assertEqual(conveniences.sat_epoch_datetime(sat), correct_epoch)
 
+def test_legacy_epoch_is_cached_and_assignable():
+    sat = io.twoline2rv(LINE1, LINE2, wgs72)
+    epoch = sat.epoch
+    assert sat.epoch is epoch
+    sat.epoch = 'custom'
+    assertEqual(sat.epoch, 'custom')
+
+    class Custom(object):
+        pass
+
+    sat = io.twoline2rv(LINE1, LINE2, wgs72, 'i', Custom())
+    assertEqual(sat.epoch, epoch)
+
+def test_legacy_satellite_pickles():
+    sat = io.twoline2rv(LINE1, LINE2, wgs72)
+    for protocol in 0, 1, 2:
+        copy = pickle.loads(pickle.dumps(sat, protocol))
+        assertEqual(vars(copy), vars(sat))
+
 def test_non_ascii_first_line():
     if sys.version_info < (3,):
         return
@@ -812,6 +888,21 @@ def test_omm_csv_matches_old_tle():
 
     assert_satellites_match(sat1, sat2)
 
+def test_omm_epoch_rejects_trailing_newline():
+    epoch = omm._parse_epoch('2023-04-25T10:45:30.642912')
+    assertEqual(epoch, dt.datetime(2023, 4, 25, 10, 45, 30, 642912))
+    with assertRaisesRegex(ValueError, 'unconverted data remains'):
+        omm._parse_epoch('2023-04-25T10:45:30.642912\n')
+
+def test_omm_epoch_out_of_range_field_raises_strptime_error():
+    text = '2023-13-25T10:45:30.642912'
+    try:
+        dt.datetime.strptime(text, '%Y-%m-%dT%H:%M:%S.%f')
+    except ValueError as e:
+        message = str(e)
+    with assertRaisesRegex(ValueError, re.escape(message)):
+        omm._parse_epoch(text)
+
 def assert_satellites_match(sat1, sat2):
     for attr in dir(sat1):
         if attr.startswith('_'):